@@ -74,10 +74,15 @@ class CloudEvent:
         raise NotImplementedError()
 
     def __eq__(self, other: typing.Any) -> bool:
+        if self is other:
+            return True
         if isinstance(other, CloudEvent):
-            same_data = self._get_data() == other._get_data()
-            same_attributes = self._get_attributes() == other._get_attributes()
-            return same_data and same_attributes
+            # Attributes are compared first as they are usually cheaper to compare
+            # than the data and already differ for most unequal events.
+            return (
+                self._get_attributes() == other._get_attributes()
+                and self._get_data() == other._get_data()
+            )
         return False
 
     def __getitem__(self, key: str) -> typing.Any:
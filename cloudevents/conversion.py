@@ -11,17 +11,135 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
+import base64
 import datetime
 import enum
 import json
+import math
 import typing
+import uuid
 
 from cloudevents import exceptions as cloud_exceptions
 from cloudevents.abstract import AnyCloudEvent
-from cloudevents.sdk import converters, marshaller, types
-from cloudevents.sdk.converters import is_binary
+from cloudevents.sdk import converters
+from cloudevents.sdk import exceptions as sdk_exceptions
+from cloudevents.sdk import marshaller, types
+from cloudevents.sdk.converters import is_binary, structured
+from cloudevents.sdk.converters.util import lower_header_keys
 from cloudevents.sdk.event import v1, v03
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover # hard to test
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:  # pragma: no cover # hard to test
+    msgpack = None
+
+
+def _json_default(value: typing.Any) -> typing.Any:
+    """
+    Encodes the values `orjson` serializes natively but `json` does not, so both
+    libraries accept the same values.
+
+    :param value: The value the JSON library is unable to serialize.
+    :returns: A JSON serializable representation of the value.
+    """
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+    # Values `json` can not serialize (datetimes, dataclasses) are passed to
+    # `_json_default`, which rejects them. Subclasses of the builtin types are
+    # rejected too and serialized by `json` instead, which may customize them.
+    _ORJSON_DUMPS_OPTIONS = (
+        orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+        | orjson.OPT_PASSTHROUGH_SUBCLASS
+    )
+
+
+def _has_non_finite_float(value: typing.Any) -> bool:
+    """
+    :returns: True if the given JSON serializable value holds a NaN or an
+        infinite float, False otherwise.
+    """
+    if type(value) is float:
+        return not math.isfinite(value)
+    if type(value) is dict:
+        return any(_has_non_finite_float(item) for item in value.values())
+    if type(value) is list or type(value) is tuple:
+        return any(_has_non_finite_float(item) for item in value)
+    return False
+
+
+def _json_dumps(value: typing.Any) -> str:
+    """
+    Serializes the given value into a JSON string using the fastest available
+    JSON library.
+
+    Falls back to the standard library `json` module when `orjson` is not
+    installed or is unable to serialize the value (e.g. non-string dict keys).
+    `orjson` writes non-finite floats as `null`, so values holding them are
+    serialized by `json`, which keeps them as `NaN` and `Infinity`.
+
+    :param value: The value to be serialized into a JSON string.
+    :returns: JSON string of the given value.
+    """
+    if orjson is not None:
+        try:
+            result = orjson.dumps(
+                value, default=_json_default, option=_ORJSON_DUMPS_OPTIONS
+            )
+        except TypeError:
+            pass
+        else:
+            # Non-finite floats can only be hidden behind a `null`
+            if b"null" not in result or not _has_non_finite_float(value):
+                return result.decode("utf-8")
+    return json.dumps(value, default=_json_default)
+
+
+# `orjson` reads integers out of the 64-bit range as floats, losing precision.
+# Any such integer has at least 19 digits, spotted by searching the document
+# with all the digits mapped to "0".
+_DIGITS_TO_ZEROS = bytes.maketrans(b"0123456789", b"0" * 10)
+_LONG_DIGITS = b"0" * 19
+
+
+def _has_long_digits(value: typing.Union[str, bytes, bytearray]) -> bool:
+    if isinstance(value, str):
+        value = value.encode("utf-8", "surrogatepass")
+    return value.translate(_DIGITS_TO_ZEROS).find(_LONG_DIGITS) != -1
+
+
+def _json_loads(value: typing.Union[str, bytes, bytearray]) -> typing.Any:
+    """
+    Deserializes the given JSON document using the fastest available JSON
+    library.
+
+    Falls back to the standard library `json` module when `orjson` is not
+    installed, rejects the document or would not read it exactly, as `orjson`
+    is stricter than `json` (e.g. it does not accept `NaN` or a UTF-8 BOM) and
+    does not support arbitrarily large integers.
+
+    :param value: The JSON document to be deserialized.
+    :returns: The deserialized python object.
+    """
+    if orjson is not None:
+        if not _has_long_digits(value):
+            try:
+                return orjson.loads(value)
+            except orjson.JSONDecodeError:
+                pass
+    return json.loads(value)
+
 
 def _best_effort_serialize_to_json(
     value: typing.Any, *args, **kwargs
@@ -38,18 +156,34 @@ def _best_effort_serialize_to_json(
     if value is None:
         return None
     try:
-        return json.dumps(value, *args, **kwargs)
+        if args or kwargs:
+            return json.dumps(value, *args, **kwargs)
+        return _json_dumps(value)
     except TypeError:
         return value
 
 
+def _identity(value: typing.Any) -> typing.Any:
+    return value
+
+
+_DEFAULT_STRUCTURED_MARSHALLER = _identity
+_DEFAULT_BINARY_MARSHALLER = _best_effort_serialize_to_json
+
 _default_marshaller_by_format = {
-    converters.TypeStructured: lambda x: x,
-    converters.TypeBinary: _best_effort_serialize_to_json,
+    converters.TypeStructured: _DEFAULT_STRUCTURED_MARSHALLER,
+    converters.TypeBinary: _DEFAULT_BINARY_MARSHALLER,
 }  # type: typing.Dict[str, types.MarshallerType]
 
 _obj_by_version = {"1.0": v1.Event, "0.3": v03.Event}
 
+_attributes_by_version = {
+    version: event_class._ce_required_fields | event_class._ce_optional_fields
+    for version, event_class in _obj_by_version.items()
+}
+
+_DEFAULT_HTTP_MARSHALLER = marshaller.NewDefaultHTTPMarshaller()
+
 
 def to_json(
     event: AnyCloudEvent,
@@ -119,17 +253,16 @@ def from_http(
             f"but instead found type {type(data)}"
         )
 
-    headers = {key.lower(): value for key, value in headers.items()}
+    headers = lower_header_keys(headers)
     if data_unmarshaller is None:
         data_unmarshaller = _json_or_string
 
-    marshall = marshaller.NewDefaultHTTPMarshaller()
-
-    if is_binary(headers):
+    binary = is_binary(headers)
+    if binary:
         specversion = headers.get("ce-specversion", None)
     else:
         try:
-            raw_ce = json.loads(data)
+            raw_ce = _json_loads(data)
         except json.decoder.JSONDecodeError:
             raise cloud_exceptions.MissingRequiredFields(
                 "Failed to read specversion from both headers and data. "
@@ -155,23 +288,80 @@ def from_http(
             f"Found invalid specversion {specversion}"
         )
 
-    event = marshall.FromRequest(
-        event_handler(), headers, data, data_unmarshaller=data_unmarshaller
-    )
-    attrs = event.Properties()
-    attrs.pop("data", None)
-    attrs.pop("extensions", None)
-    attrs.update(**event.extensions)
+    if binary:
+        event = _DEFAULT_HTTP_MARSHALLER.FromRequest(
+            event_handler(), headers, data, data_unmarshaller=data_unmarshaller
+        )
+        attrs = event.Properties()
+        attrs.pop("data", None)
+        attrs.pop("extensions", None)
+        attrs.update(event.extensions)
+        data = event.data
+    else:
+        if not callable(data_unmarshaller):
+            raise sdk_exceptions.InvalidDataUnmarshaller()
+        # The body was already parsed above, so it is not parsed again.
+        attrs, data = _read_structured(raw_ce, specversion, data_unmarshaller)
 
-    if event.data == "" or event.data == b"":
+    if data == "" or data == b"":
         # TODO: Check binary unmarshallers to debug why setting data to ""
         # returns an event with data set to None, but structured will return ""
         data = None
-    else:
-        data = event.data
     return event_type.create(attrs, data)
 
 
+def _read_structured(
+    raw_ce: typing.Dict[str, typing.Any],
+    specversion: str,
+    data_unmarshaller: types.UnmarshallerType,
+) -> typing.Tuple[typing.Dict[str, typing.Any], typing.Any]:
+    """
+    Reads the attributes and the data of a parsed structured CloudEvent.
+
+    The result is equivalent to reading the event into an SDK event, without
+    setting every attribute on an SDK event object one by one first.
+
+    :param raw_ce: The parsed structured CloudEvent.
+    :param specversion: The supported specversion of the event.
+    :param data_unmarshaller: Callable function to map data to a python object.
+    :returns: (attributes: dict, data)
+    """
+    event_class = _obj_by_version[specversion]
+    missing_fields = event_class._ce_required_fields - raw_ce.keys()
+    if len(missing_fields) > 0:
+        raise cloud_exceptions.MissingRequiredFields(
+            f"Missing required attributes: {missing_fields}"
+        )
+
+    known_attributes = _attributes_by_version[specversion]
+    attributes = {}
+    data = None
+    for name, value in raw_ce.items():
+        if name == "data" or name == "data_base64":
+            try:
+                if name == "data_base64":
+                    data = data_unmarshaller(base64.b64decode(value))
+                elif data_unmarshaller is _json_or_string:
+                    # Would only round-trip the already parsed data through JSON
+                    data = value
+                else:
+                    # Use the user-provided serializer, which may have customized
+                    # JSON decoding
+                    data = data_unmarshaller(json.dumps(value))
+            except Exception as e:
+                raise cloud_exceptions.DataUnmarshallerError(
+                    "Failed to unmarshall data with error: "
+                    f"{type(e).__name__}('{e}')"
+                )
+        elif value is not None or name not in known_attributes:
+            attributes[name] = value
+        elif name in event_class._ce_required_fields:
+            raise cloud_exceptions.InvalidRequiredFields(
+                f"Required attribute {name} must not be null"
+            )
+    return attributes, data
+
+
 def _to_http(
     event: AnyCloudEvent,
     format: str = converters.TypeStructured,
@@ -188,21 +378,81 @@ def _to_http(
     if data_marshaller is None:
         data_marshaller = _default_marshaller_by_format[format]
 
-    if event["specversion"] not in _obj_by_version:
+    specversion = event["specversion"]
+    event_handler_class = _obj_by_version.get(specversion)
+    if event_handler_class is None:
         raise cloud_exceptions.InvalidRequiredFields(
-            f"Unsupported specversion: {event['specversion']}"
+            f"Unsupported specversion: {specversion}"
         )
 
-    event_handler = _obj_by_version[event["specversion"]]()
-    for attribute_name in event:
-        event_handler.Set(attribute_name, event[attribute_name])
+    event_handler = event_handler_class()
+    for attribute_name, attribute_value in event._get_attributes().items():
+        event_handler.Set(attribute_name, attribute_value)
     event_handler.data = event.data
 
-    return marshaller.NewDefaultHTTPMarshaller().ToRequest(
+    return _DEFAULT_HTTP_MARSHALLER.ToRequest(
         event_handler, format, data_marshaller=data_marshaller
     )
 
 
+def _to_structured_fast(
+    event: AnyCloudEvent,
+    data_marshaller: types.MarshallerType = None,
+) -> typing.Tuple[dict, bytes]:
+    """
+    Returns a tuple of HTTP headers/body dicts representing this Cloud Event
+    in the structured format.
+
+    Unlike `_to_http` the attributes are serialized directly instead of being
+    copied one by one into an SDK event first. The output is equivalent to the
+    one produced by the SDK structured converter.
+
+    :param data_marshaller: Callable function that casts event.data into
+        either a string or bytes.
+    :returns: (http_headers: dict, http_body: bytes)
+    """
+    if data_marshaller is not None and not callable(data_marshaller):
+        raise sdk_exceptions.InvalidDataMarshaller()
+
+    specversion = event["specversion"]
+    if specversion not in _attributes_by_version:
+        raise cloud_exceptions.InvalidRequiredFields(
+            f"Unsupported specversion: {specversion}"
+        )
+
+    # Mirrors the SDK event, which omits unset (None) optional context attributes
+    # but keeps extensions as is.
+    required_attributes = _obj_by_version[specversion]._ce_required_fields
+    known_attributes = _attributes_by_version[specversion]
+    body = {}
+    for attribute_name, attribute_value in event._get_attributes().items():
+        if attribute_value is not None or attribute_name not in known_attributes:
+            body[attribute_name] = attribute_value
+        elif attribute_name in required_attributes:
+            raise cloud_exceptions.InvalidRequiredFields(
+                f"Required attribute {attribute_name} must not be null"
+            )
+
+    data = event.data
+    if data is not None:
+        # The default structured marshaller is the identity function, so the
+        # data is only passed through a user-provided marshaller.
+        if data_marshaller is not None:
+            try:
+                data = data_marshaller(data)
+            except Exception as e:
+                raise cloud_exceptions.DataMarshallerError(
+                    f"Failed to marshall data with error: {type(e).__name__}('{e}')"
+                )
+        if isinstance(data, (bytes, bytearray, memoryview)):
+            body["data_base64"] = base64.b64encode(data).decode("ascii")
+        else:
+            body["data"] = data
+
+    headers = {"content-type": structured.JSONHTTPCloudEventConverter.MIME_TYPE}
+    return headers, _json_dumps(body).encode("utf-8")
+
+
 def to_structured(
     event: AnyCloudEvent,
     data_marshaller: types.MarshallerType = None,
@@ -218,7 +468,7 @@ def to_structured(
         either a string or bytes
     :returns: (http_headers: dict, http_body: bytes or str)
     """
-    return _to_http(event=event, data_marshaller=data_marshaller)
+    return _to_structured_fast(event=event, data_marshaller=data_marshaller)
 
 
 def to_binary(
@@ -234,6 +484,8 @@ def to_binary(
         either a string or bytes.
     :returns: (http_headers: dict, http_body: bytes or str)
     """
+    if data_marshaller is None:
+        data_marshaller = _DEFAULT_BINARY_MARSHALLER
     return _to_http(
         event=event,
         format=converters.TypeBinary,
@@ -241,6 +493,18 @@ def to_binary(
     )
 
 
+# Exact-type fast path of best_effort_encode_attribute_value for the most common
+# attribute value types. Subclasses (e.g. str-based enums) take the slow path.
+_attribute_value_encoder_by_type = {
+    str: _identity,
+    int: _identity,
+    float: _identity,
+    bool: _identity,
+    type(None): _identity,
+    datetime.datetime: datetime.datetime.isoformat,
+}  # type: typing.Dict[type, typing.Callable[[typing.Any], typing.Any]]
+
+
 def best_effort_encode_attribute_value(value: typing.Any) -> typing.Any:
     """
     SHOULD convert any value into a JSON serialization friendly format.
@@ -251,6 +515,10 @@ def best_effort_encode_attribute_value(value: typing.Any) -> typing.Any:
     :param value: Value which MAY or MAY NOT be JSON serializable.
     :return: Possibly encoded value.
     """
+    encoder = _attribute_value_encoder_by_type.get(type(value))
+    if encoder is not None:
+        return encoder(value)
+
     if isinstance(value, enum.Enum):
         return value.value
     if isinstance(value, datetime.datetime):
@@ -271,11 +539,17 @@ def from_dict(
     :param event_type: The type of the event to be constructed from the dict.
     :returns: The event of the specified type backed by the given dict.
     """
-    attributes = {
-        attr_name: best_effort_encode_attribute_value(attr_value)
-        for attr_name, attr_value in event.items()
-        if attr_name != "data"
-    }
+    if any(
+        isinstance(value, (enum.Enum, datetime.datetime)) for value in event.values()
+    ):
+        attributes = {
+            attr_name: best_effort_encode_attribute_value(attr_value)
+            for attr_name, attr_value in event.items()
+            if attr_name != "data"
+        }
+    else:
+        attributes = dict(event)
+        attributes.pop("data", None)
     return event_type.create(attributes=attributes, data=event.get("data"))
 
 
@@ -286,11 +560,187 @@ def to_dict(event: AnyCloudEvent) -> typing.Dict[str, typing.Any]:
     :param event: The event to be converted into a dict.
     :returns: The canonical dict representation of the event.
     """
-    result = {attribute_name: event.get(attribute_name) for attribute_name in event}
+    result = dict(event._get_attributes())
     result["data"] = event.data
     return result
 
 
+def _ensure_msgpack_installed() -> None:
+    if msgpack is None:
+        raise cloud_exceptions.MsgPackFeatureNotInstalled(
+            "CloudEvents msgpack feature is not installed. "
+            "Install it using pip install cloudevents[msgpack]"
+        )
+
+
+def to_msgpack(event: AnyCloudEvent) -> bytes:
+    """
+    Converts given `event` to its MessagePack representation.
+
+    The event is encoded as a MessagePack map of its canonical dict
+    representation. Binary `data` is kept as is rather than being base64-encoded.
+
+    :param event: The event to be converted.
+    :returns: The MessagePack representation of the event.
+    """
+    _ensure_msgpack_installed()
+    return msgpack.packb(
+        to_dict(event),
+        use_bin_type=True,
+        default=best_effort_encode_attribute_value,
+    )
+
+
+def from_msgpack(
+    event_type: typing.Type[AnyCloudEvent],
+    data: bytes,
+) -> AnyCloudEvent:
+    """
+    Parses MessagePack `data` into a CloudEvent.
+
+    :param event_type: A concrete type of the event into which the data is
+        deserialized.
+    :param data: MessagePack representation of a CloudEvent.
+    :returns: A CloudEvent parsed from the given MessagePack representation.
+    """
+    _ensure_msgpack_installed()
+    try:
+        event = msgpack.unpackb(data, raw=False, strict_map_key=False)
+    except (ValueError, TypeError) as e:
+        raise cloud_exceptions.InvalidStructuredMsgPack(
+            f"Failed to read MessagePack data with error: {type(e).__name__}('{e}')"
+        )
+    return _from_msgpack_object(event_type, event)
+
+
+def to_msgpack_sequence(
+    events: typing.Iterable[AnyCloudEvent],
+) -> typing.Iterator[bytes]:
+    """
+    Converts given `events` into a sequence of MessagePack encoded events.
+
+    Encoded events are self-delimiting, so the chunks may be concatenated and
+    streamed as is, letting the consumer decode the batch event by event.
+
+    :param events: The events to be converted.
+    :returns: An iterator over the MessagePack representations of the events.
+    """
+    _ensure_msgpack_installed()
+    return _to_msgpack_sequence(events)
+
+
+def _to_msgpack_sequence(
+    events: typing.Iterable[AnyCloudEvent],
+) -> typing.Iterator[bytes]:
+    packer = msgpack.Packer(
+        use_bin_type=True, default=best_effort_encode_attribute_value
+    )
+    for event in events:
+        yield packer.pack(to_dict(event))
+
+
+def from_msgpack_sequence(
+    event_type: typing.Type[AnyCloudEvent],
+    chunks: typing.Iterable[bytes],
+) -> typing.Iterator[AnyCloudEvent]:
+    """
+    Parses a stream of MessagePack encoded events into CloudEvents.
+
+    The events are yielded as soon as they are fully read, the whole stream is
+    never buffered. The chunks do not have to be aligned with event boundaries.
+
+    :param event_type: A concrete type of the events into which the data is
+        deserialized.
+    :param chunks: The MessagePack stream, e.g. as produced by
+        `to_msgpack_sequence`.
+    :returns: An iterator over the CloudEvents parsed from the stream.
+    """
+    _ensure_msgpack_installed()
+    return _from_msgpack_sequence(event_type, chunks)
+
+
+def _from_msgpack_sequence(
+    event_type: typing.Type[AnyCloudEvent],
+    chunks: typing.Iterable[bytes],
+) -> typing.Iterator[AnyCloudEvent]:
+    unpacker = msgpack.Unpacker(raw=False, strict_map_key=False)
+    fed_size = 0
+    read_size = 0
+    for chunk in chunks:
+        unpacker.feed(chunk)
+        fed_size += len(chunk)
+        while True:
+            try:
+                event = next(unpacker)
+            except StopIteration:
+                break
+            except (ValueError, TypeError) as e:
+                raise cloud_exceptions.InvalidStructuredMsgPack(
+                    "Failed to read MessagePack data with error: "
+                    f"{type(e).__name__}('{e}')"
+                )
+            read_size = unpacker.tell()
+            yield _from_msgpack_object(event_type, event)
+
+    if read_size != fed_size:
+        raise cloud_exceptions.InvalidStructuredMsgPack(
+            "MessagePack stream ended in the middle of an event"
+        )
+
+
+def _from_msgpack_object(
+    event_type: typing.Type[AnyCloudEvent],
+    event: typing.Any,
+) -> AnyCloudEvent:
+    if not isinstance(event, dict):
+        raise cloud_exceptions.InvalidStructuredMsgPack(
+            f"Expected a MessagePack map, but instead found type {type(event)}"
+        )
+    # Non-string keys are allowed while unpacking for the sake of the data, but
+    # attribute names must be strings.
+    for attribute_name in event:
+        if not isinstance(attribute_name, str):
+            raise cloud_exceptions.InvalidStructuredMsgPack(
+                "Expected attribute names of type str, "
+                f"but instead found type {type(attribute_name)}"
+            )
+
+    # Validated like a structured JSON event, as from_dict fills in the missing
+    # specversion and id.
+    specversion = event.get("specversion", None)
+    if specversion is None:
+        raise cloud_exceptions.MissingRequiredFields(
+            "Failed to find specversion in MessagePack data"
+        )
+    event_class = _obj_by_version.get(specversion, None)
+    if event_class is None:
+        raise cloud_exceptions.InvalidRequiredFields(
+            f"Found invalid specversion {specversion}"
+        )
+    missing_fields = event_class._ce_required_fields - event.keys()
+    if len(missing_fields) > 0:
+        raise cloud_exceptions.MissingRequiredFields(
+            f"Missing required attributes: {missing_fields}"
+        )
+    for attribute_name in event_class._ce_required_fields:
+        if event[attribute_name] is None:
+            raise cloud_exceptions.InvalidRequiredFields(
+                f"Required attribute {attribute_name} must not be null"
+            )
+    return from_dict(event_type, event)
+
+
+# Bytes a UTF-8 JSON document may start with, after any leading whitespace. Also
+# holds the `NaN` and `Infinity` constants and the first byte of a UTF-8 BOM,
+# which `json` accepts.
+_JSON_FIRST_BYTES = b'{["-0123456789tfnNI\xef'
+# `json` also detects UTF-16 and UTF-32 documents, which start with one of these
+# bytes (either part of a BOM or the high byte of the first character).
+_JSON_UTF16_UTF32_FIRST_BYTES = (b"\x00", b"\xfe", b"\xff")
+# Only this many leading bytes are looked at, the body is never copied whole.
+_JSON_PREFIX_SIZE = 64
+
+
 def _json_or_string(
     content: typing.Optional[typing.AnyStr],
 ) -> typing.Optional[
@@ -308,7 +758,16 @@ def _json_or_string(
     """
     if content is None:
         return None
+    if (
+        isinstance(content, (bytes, bytearray))
+        and content[:1] not in _JSON_UTF16_UTF32_FIRST_BYTES
+    ):
+        # Empty when the prefix is all whitespace, which is always parsed
+        first_byte = content[:_JSON_PREFIX_SIZE].lstrip()[:1]
+        if first_byte not in _JSON_FIRST_BYTES:
+            # Can not be a JSON document, skip the failing (and costly) parse.
+            return content
     try:
-        return json.loads(content)
+        return _json_loads(content)
     except (json.JSONDecodeError, TypeError, UnicodeDecodeError):
         return content
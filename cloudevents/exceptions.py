@@ -29,6 +29,10 @@ class InvalidStructuredJSON(GenericException):
     pass
 
 
+class InvalidStructuredMsgPack(GenericException):
+    pass
+
+
 class InvalidHeadersFormat(GenericException):
     pass
 
@@ -52,3 +56,9 @@ class PydanticFeatureNotInstalled(GenericException):
     """
     Raised when a user tries to use the pydantic feature but did not install it.
     """
+
+
+class MsgPackFeatureNotInstalled(GenericException):
+    """
+    Raised when a user tries to use the msgpack feature but did not install it.
+    """
@@ -13,7 +13,13 @@
 #    under the License.
 
 
-from cloudevents.http.conversion import from_dict, from_http, from_json
+from cloudevents.http.conversion import (
+    from_dict,
+    from_http,
+    from_json,
+    from_msgpack,
+    from_msgpack_sequence,
+)
 from cloudevents.http.event import CloudEvent
 from cloudevents.http.event_type import is_binary, is_structured  # deprecated
 from cloudevents.http.http_methods import (  # deprecated
@@ -30,6 +36,8 @@ __all__ = [
     from_json,
     from_http,
     from_dict,
+    from_msgpack,
+    from_msgpack_sequence,
     CloudEvent,
     is_binary,
     is_structured,
@@ -58,8 +58,7 @@ class CloudEvent(abstract.CloudEvent):
         """
         self._attributes = {k.lower(): v for k, v in attributes.items()}
         self.data = data
-        if "specversion" not in self._attributes:
-            self._attributes["specversion"] = "1.0"
+        specversion = self._attributes.setdefault("specversion", "1.0")
         if "id" not in self._attributes:
             self._attributes["id"] = str(uuid.uuid4())
         if "time" not in self._attributes:
@@ -67,13 +66,13 @@ class CloudEvent(abstract.CloudEvent):
                 datetime.timezone.utc
             ).isoformat()
 
-        if self._attributes["specversion"] not in _required_by_version:
+        required_set = _required_by_version.get(specversion)
+        if required_set is None:
             raise cloud_exceptions.MissingRequiredFields(
-                f"Invalid specversion: {self._attributes['specversion']}"
+                f"Invalid specversion: {specversion}"
             )
         # There is no good way to default 'source' and 'type', so this
         # checks for those (or any new required attributes).
-        required_set = _required_by_version[self._attributes["specversion"]]
         if not required_set <= self._attributes.keys():
             raise cloud_exceptions.MissingRequiredFields(
                 f"Missing required keys: {required_set - self._attributes.keys()}"
@@ -11,7 +11,20 @@
 #    WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied. See the
 #    License for the specific language governing permissions and limitations
 #    under the License.
-from cloudevents.pydantic.conversion import from_dict, from_http, from_json
+from cloudevents.pydantic.conversion import (
+    from_dict,
+    from_http,
+    from_json,
+    from_msgpack,
+    from_msgpack_sequence,
+)
 from cloudevents.pydantic.event import CloudEvent
 
-__all__ = [CloudEvent, from_json, from_dict, from_http]
+__all__ = [
+    CloudEvent,
+    from_json,
+    from_dict,
+    from_http,
+    from_msgpack,
+    from_msgpack_sequence,
+]
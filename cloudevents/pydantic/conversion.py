@@ -16,6 +16,10 @@ import typing
 from cloudevents.conversion import from_dict as _abstract_from_dict
 from cloudevents.conversion import from_http as _abstract_from_http
 from cloudevents.conversion import from_json as _abstract_from_json
+from cloudevents.conversion import from_msgpack as _abstract_from_msgpack
+from cloudevents.conversion import (
+    from_msgpack_sequence as _abstract_from_msgpack_sequence,
+)
 from cloudevents.pydantic.event import CloudEvent
 from cloudevents.sdk import types
 
@@ -72,3 +76,25 @@ def from_dict(
     :returns: A CloudEvent parsed from the given dict representation.
     """
     return _abstract_from_dict(CloudEvent, event)
+
+
+def from_msgpack(data: bytes) -> CloudEvent:
+    """
+    Parses MessagePack `data` into a CloudEvent.
+
+    :param data: MessagePack representation of a CloudEvent.
+    :returns: A CloudEvent parsed from the given MessagePack representation.
+    """
+    return _abstract_from_msgpack(CloudEvent, data)
+
+
+def from_msgpack_sequence(
+    chunks: typing.Iterable[bytes],
+) -> typing.Iterator[CloudEvent]:
+    """
+    Parses a stream of MessagePack encoded events into CloudEvents.
+
+    :param chunks: The MessagePack stream.
+    :returns: An iterator over the CloudEvents parsed from the stream.
+    """
+    return _abstract_from_msgpack_sequence(CloudEvent, chunks)
@@ -16,7 +16,7 @@ import typing
 
 from cloudevents.sdk import exceptions, types
 from cloudevents.sdk.converters import base
-from cloudevents.sdk.converters.util import has_binary_headers
+from cloudevents.sdk.converters.util import has_binary_headers, lower_header_keys
 from cloudevents.sdk.event import base as event_base
 from cloudevents.sdk.event import v1, v03
 
@@ -67,7 +67,7 @@ def is_binary(headers: typing.Dict[str, str]) -> bool:
     :returns: Returns a bool indicating whether the headers indicate
         a binary event type.
     """
-    headers = {key.lower(): value for key, value in headers.items()}
+    headers = lower_header_keys(headers)
     content_type = headers.get("content-type", "")
     binary_parser = BinaryHTTPCloudEventConverter()
     return binary_parser.can_read(content_type=content_type, headers=headers)
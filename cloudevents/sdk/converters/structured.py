@@ -16,7 +16,7 @@ import typing
 
 from cloudevents.sdk import types
 from cloudevents.sdk.converters import base
-from cloudevents.sdk.converters.util import has_binary_headers
+from cloudevents.sdk.converters.util import has_binary_headers, lower_header_keys
 from cloudevents.sdk.event import base as event_base
 
 
@@ -66,7 +66,7 @@ def is_structured(headers: typing.Dict[str, str]) -> bool:
     :returns: Returns a bool indicating whether the headers indicate
         a structured event type.
     """
-    headers = {key.lower(): value for key, value in headers.items()}
+    headers = lower_header_keys(headers)
     content_type = headers.get("content-type", "")
     structured_parser = JSONHTTPCloudEventConverter()
     return structured_parser.can_read(content_type=content_type, headers=headers)
@@ -27,3 +27,17 @@ def has_binary_headers(headers: typing.Dict[str, str]) -> bool:
         and "ce-type" in headers
         and "ce-id" in headers
     )
+
+
+def lower_header_keys(headers: typing.Dict[str, str]) -> typing.Dict[str, str]:
+    """Returns the given `headers` with all the keys lower-cased.
+
+    Most HTTP frameworks already lower-case the header names, in which case a
+    plain `dict` is returned as is instead of being copied. Any other mapping is
+    always copied into a `dict`, as its `keys()` may not support set operations.
+
+    :returns: The HTTP headers with lower-cased keys.
+    """
+    if type(headers) is dict and all(key.islower() for key in headers):
+        return headers
+    return {key.lower(): value for key, value in headers.items()}
@@ -164,13 +164,26 @@ class BaseEvent(EventGetterSetter):
     _ce_required_fields = set()
     _ce_optional_fields = set()
 
+    # Binary-mode header names, derived from the fields of each subclass
+    _ce_required_headers = set()
+    _ce_header_by_attribute = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._ce_required_headers = {f"ce-{field}" for field in cls._ce_required_fields}
+        cls._ce_header_by_attribute = {
+            field: f"ce-{field}"
+            for field in cls._ce_required_fields | cls._ce_optional_fields
+            if field != "datacontenttype"
+        }
+
     def Properties(self, with_nullable=False) -> dict:
         props = dict()
-        for name, value in self.__dict__.items():
-            if str(name).startswith("ce__"):
-                v = value.get()
-                if v is not None or with_nullable:
-                    props.update({str(name).replace("ce__", ""): value.get()})
+        for name, option in self.__dict__.items():
+            if name.startswith("ce__"):
+                value = option.get()
+                if value is not None or with_nullable:
+                    props[name[4:]] = value
 
         return props
 
@@ -255,8 +268,7 @@ class BaseEvent(EventGetterSetter):
         body: typing.Union[bytes, str],
         data_unmarshaller: types.UnmarshallerType,
     ):
-        required_binary_fields = {f"ce-{field}" for field in self._ce_required_fields}
-        missing_fields = required_binary_fields - headers.keys()
+        missing_fields = self._ce_required_headers - headers.keys()
 
         if len(missing_fields) > 0:
             raise cloud_exceptions.MissingRequiredFields(
@@ -287,10 +299,10 @@ class BaseEvent(EventGetterSetter):
         if self.ContentType():
             headers["content-type"] = self.ContentType()
         props = self.Properties()
+        header_by_attribute = self._ce_header_by_attribute
         for key, value in props.items():
-            if key not in ["data", "extensions", "datacontenttype"]:
-                if value is not None:
-                    headers["ce-{0}".format(key)] = value
+            if key in header_by_attribute and value is not None:
+                headers[header_by_attribute[key]] = value
 
         for key, value in props.get("extensions").items():
             headers["ce-{0}".format(key)] = value
@@ -17,6 +17,7 @@ import typing
 
 from cloudevents.sdk import exceptions, types
 from cloudevents.sdk.converters import base, binary, structured
+from cloudevents.sdk.converters.util import lower_header_keys
 from cloudevents.sdk.event import base as event_base
 
 
@@ -59,7 +60,7 @@ class HTTPMarshaller(object):
             raise exceptions.InvalidDataUnmarshaller()
 
         # Lower all header keys
-        headers = {key.lower(): value for key, value in headers.items()}
+        headers = lower_header_keys(headers)
         content_type = headers.get("content-type", None)
 
         for cnvrtr in self.http_converters:
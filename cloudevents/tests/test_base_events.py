@@ -12,6 +12,9 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import base64
+import json
+
 import pytest
 
 import cloudevents.exceptions as cloud_exceptions
@@ -32,3 +35,46 @@ def test_get_nonexistent_optional(event_class):
     event.SetExtensions({"ext1": "val"})
     res = event.Get("ext1")
     assert res[0] == "val" and res[1] is True
+
+
+@pytest.mark.parametrize("event_class", [v1.Event, v03.Event])
+def test_unmarshall_json_missing_fields(event_class):
+    event = event_class()
+    with pytest.raises(cloud_exceptions.MissingRequiredFields) as e:
+        event.UnmarshalJSON("{}", lambda x: x)
+    assert "Missing required attributes: " in str(e.value)
+
+
+@pytest.mark.parametrize("event_class", [v1.Event, v03.Event])
+@pytest.mark.parametrize(
+    "data_attributes, expected_data",
+    [
+        ({"data": {"hello": "world"}}, '{"hello": "world"}'),
+        ({"data_base64": base64.b64encode(b"\x00\x01").decode()}, b"\x00\x01"),
+    ],
+)
+def test_unmarshall_json_data(event_class, data_attributes, expected_data):
+    event = event_class()
+    raw_ce = {
+        "specversion": event.CloudEventVersion(),
+        "id": "1",
+        "source": "s",
+        "type": "t",
+        **data_attributes,
+    }
+    event.UnmarshalJSON(json.dumps(raw_ce), lambda x: x)
+    assert event.Data() == expected_data
+
+
+@pytest.mark.parametrize("event_class", [v1.Event, v03.Event])
+def test_unmarshall_json_data_unmarshaller_error(event_class):
+    event = event_class()
+    raw_ce = {
+        "specversion": event.CloudEventVersion(),
+        "id": "1",
+        "source": "s",
+        "type": "t",
+        "data": "data",
+    }
+    with pytest.raises(cloud_exceptions.DataUnmarshallerError):
+        event.UnmarshalJSON(json.dumps(raw_ce), lambda x: 1 / 0)
@@ -12,10 +12,13 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import types
+
 import pytest
 
 from cloudevents.sdk import exceptions
 from cloudevents.sdk.converters import base, binary
+from cloudevents.sdk.converters.util import lower_header_keys
 
 
 def test_binary_converter_raise_unsupported():
@@ -40,3 +43,23 @@ def test_base_converters_raise_exceptions():
     with pytest.raises(Exception):
         cnvtr = base.Converter()
         cnvtr.read(None, None, None, None)
+
+
+def test_lower_header_keys_keeps_lower_case_headers():
+    headers = {"ce-id": "1", "content-type": "application/json"}
+    assert lower_header_keys(headers) is headers
+
+
+def test_lower_header_keys_lowers_mixed_case_headers():
+    headers = {"Ce-Id": "1", "content-type": "application/json"}
+    assert lower_header_keys(headers) == {
+        "ce-id": "1",
+        "content-type": "application/json",
+    }
+
+
+def test_lower_header_keys_copies_other_mappings():
+    headers = types.MappingProxyType({"ce-id": "1"})
+    result = lower_header_keys(headers)
+    assert type(result) is dict
+    assert result == {"ce-id": "1"}
@@ -12,10 +12,12 @@
 #    License for the specific language governing permissions and limitations
 #    under the License.
 
+import json
+
 import pytest
 
 import cloudevents.exceptions as cloud_exceptions
-from cloudevents.conversion import _json_or_string
+from cloudevents.conversion import _best_effort_serialize_to_json, _json_or_string
 from cloudevents.http import CloudEvent
 
 
@@ -83,6 +85,22 @@ def test_http_cloudevent_equality(dummy_attributes, my_dummy_data, your_dummy_da
     assert event1 != event2 and event3 != event1
 
 
+def test_http_cloudevent_must_equal_to_itself(dummy_event):
+    assert dummy_event == dummy_event
+
+
+def test_http_cloudevent_equality_must_not_compare_data_of_different_attributes(
+    dummy_attributes,
+):
+    class _UncomparableData:
+        def __eq__(self, other):
+            raise AssertionError("data must not be compared")  # pragma: no cover
+
+    event1 = CloudEvent(dummy_attributes, _UncomparableData())
+    event2 = CloudEvent({**dummy_attributes, "id": "other"}, _UncomparableData())
+    assert event1 != event2
+
+
 @pytest.mark.parametrize(
     "non_cloudevent_value",
     (
@@ -177,12 +195,44 @@ def test_cloudevent_general_overrides():
         (b"Hello World", b"Hello World"),
         ("Hello World", "Hello World"),
         (b"\x00\x00\x11Hello World", b"\x00\x00\x11Hello World"),
+        (b" \n[1, 2]", [1, 2]),
+        ("123", 123),
+        ('{"hello": ', '{"hello": '),
+        (b"", b""),
+        (bytearray(b"Hello World"), bytearray(b"Hello World")),
     ],
 )
 def test_json_or_string_match_golden_sample(given, expected):
     assert _json_or_string(given) == expected
 
 
+@pytest.mark.parametrize(
+    "given",
+    [
+        {"hello": "world"},
+        {1: "non-string key"},
+        [1, 2.5, None, True],
+        "Hello World",
+    ],
+)
+def test_best_effort_serialize_to_json_matches_stdlib(given):
+    assert json.loads(_best_effort_serialize_to_json(given)) == json.loads(
+        json.dumps(given)
+    )
+
+
+def test_best_effort_serialize_to_json_passes_arguments_to_stdlib():
+    value = {"hello": "world"}
+    assert _best_effort_serialize_to_json(value, indent=2) == json.dumps(
+        value, indent=2
+    )
+
+
+def test_best_effort_serialize_to_json_returns_non_serializable_as_is():
+    value = object()
+    assert _best_effort_serialize_to_json(value) is value
+
+
 def test_get_operation_on_non_existing_attribute_must_not_raise_exception(
     dummy_event, non_exiting_attribute_name
 ):
@@ -13,14 +13,39 @@
 #    under the License.
 
 import base64
+import codecs
+import collections.abc
 import datetime
+import enum
 import json
+import math
+import uuid
 
+import msgpack
 import pytest
 
-from cloudevents.conversion import to_dict, to_json
-from cloudevents.http import CloudEvent, from_dict, from_json
+import cloudevents.conversion
+import cloudevents.exceptions as cloud_exceptions
+from cloudevents.conversion import (
+    _to_http,
+    best_effort_encode_attribute_value,
+    to_binary,
+    to_dict,
+    to_json,
+    to_msgpack,
+    to_msgpack_sequence,
+    to_structured,
+)
+from cloudevents.http import (
+    CloudEvent,
+    from_dict,
+    from_http,
+    from_json,
+    from_msgpack,
+    from_msgpack_sequence,
+)
 from cloudevents.sdk.event.attribute import SpecVersion
+from cloudevents.sdk.exceptions import InvalidDataMarshaller
 
 test_data = json.dumps({"data-key": "val"})
 test_attributes = {
@@ -157,3 +182,304 @@ def test_from_dict():
         "time": "2022-07-16T12:03:20.519216+00:00",
         "type": "dummy.type",
     }
+
+
+def test_from_dict_without_encodable_attributes():
+    given = {
+        "data": {"data-key": "val"},
+        "id": "11775cb2-fd00-4487-a18b-30c3600eaa5f",
+        "source": "dummy:source",
+        "specversion": "1.0",
+        "time": "2022-07-16T12:03:20.519216+00:00",
+        "type": "dummy.type",
+    }
+    assert to_dict(from_dict(given)) == given
+
+
+@pytest.mark.parametrize("specversion", ["0.3", "1.0"])
+@pytest.mark.parametrize(
+    "data", [None, {"data-key": "val"}, "string data", b"\x00\x00\x11Hello World"]
+)
+def test_to_structured_matches_sdk_converter(specversion, data):
+    attributes = {
+        "specversion": specversion,
+        "type": "com.example.string",
+        "source": "https://example.com/event-producer",
+        "subject": None,
+        "ext1": "value",
+        "ext2": None,
+    }
+    event = CloudEvent(attributes, data)
+
+    headers, body = to_structured(event)
+    expected_headers, expected_body = _to_http(event)
+
+    assert headers == expected_headers
+    assert json.loads(body) == json.loads(expected_body)
+
+
+@pytest.mark.parametrize("specversion", ["0.3", "1.0"])
+def test_to_structured_null_required_attribute(specversion):
+    event = CloudEvent({**test_attributes, "specversion": specversion}, test_data)
+    event["source"] = None
+    with pytest.raises(cloud_exceptions.InvalidRequiredFields) as e:
+        to_structured(event)
+    assert "Required attribute source must not be null" in str(e.value)
+
+
+def test_to_structured_invalid_data_marshaller():
+    event = CloudEvent(test_attributes, test_data)
+    with pytest.raises(InvalidDataMarshaller):
+        to_structured(event, data_marshaller="")
+
+
+def test_to_structured_unsupported_specversion():
+    event = CloudEvent(test_attributes, test_data)
+    event["specversion"] = "0.2"
+    with pytest.raises(cloud_exceptions.InvalidRequiredFields) as e:
+        to_structured(event)
+    assert "Unsupported specversion: 0.2" in str(e.value)
+
+
+class _CustomDateTime(datetime.datetime):
+    pass
+
+
+@pytest.mark.parametrize(
+    "given, expected",
+    [
+        ("value", "value"),
+        (5, 5),
+        (None, None),
+        (SpecVersion.v1_0, "1.0"),
+        (datetime.datetime(2022, 7, 16, 12, 3, 20), "2022-07-16T12:03:20"),
+        (_CustomDateTime(2022, 7, 16, 12, 3, 20), "2022-07-16T12:03:20"),
+        (["a", 1], ["a", 1]),
+    ],
+)
+def test_best_effort_encode_attribute_value(given, expected):
+    assert best_effort_encode_attribute_value(given) == expected
+
+
+@pytest.mark.parametrize("specversion", ["0.3", "1.0"])
+@pytest.mark.parametrize("data", [None, {"data-key": "val"}, b"\x00\x01"])
+def test_msgpack_can_talk_to_itself(specversion, data):
+    event = CloudEvent({**test_attributes, "specversion": specversion}, data)
+    assert from_msgpack(to_msgpack(event)) == event
+
+
+def test_msgpack_can_talk_to_itself_with_non_string_data_keys():
+    event = CloudEvent(test_attributes, {1: "a", "b": {2: "c"}})
+    assert from_msgpack(to_msgpack(event)) == event
+    stream = b"".join(to_msgpack_sequence([event, event]))
+    assert list(from_msgpack_sequence([stream])) == [event, event]
+
+
+def test_to_msgpack_encodes_attribute_values():
+    event = CloudEvent(
+        {
+            **test_attributes,
+            "specversion": SpecVersion.v1_0,
+            "time": datetime.datetime(2022, 7, 16, 12, 3, 20),
+        }
+    )
+    result = from_msgpack(to_msgpack(event))
+    assert result["specversion"] == "1.0"
+    assert result["time"] == "2022-07-16T12:03:20"
+
+
+@pytest.mark.parametrize(
+    "data", [b"\xc1", b"\x92\x01", b"\x93\x01\x02\x03", b"\x81\x01\x02"]
+)
+def test_from_msgpack_invalid_data(data):
+    with pytest.raises(cloud_exceptions.InvalidStructuredMsgPack):
+        from_msgpack(data)
+
+
+@pytest.mark.parametrize(
+    "attributes, error",
+    [
+        ({}, cloud_exceptions.MissingRequiredFields),
+        ({"specversion": None}, cloud_exceptions.MissingRequiredFields),
+        ({"specversion": "0.2"}, cloud_exceptions.InvalidRequiredFields),
+        ({"specversion": "1.0"}, cloud_exceptions.MissingRequiredFields),
+        ({"specversion": "1.0", "id": None}, cloud_exceptions.InvalidRequiredFields),
+    ],
+)
+def test_from_msgpack_invalid_attributes(attributes, error):
+    data = msgpack.packb({**test_attributes, **attributes})
+    with pytest.raises(error):
+        from_msgpack(data)
+    with pytest.raises(error):
+        list(from_msgpack_sequence([data]))
+
+
+def test_msgpack_sequence_can_talk_to_itself():
+    events = [CloudEvent(test_attributes, {"index": i}) for i in range(3)]
+    stream = b"".join(to_msgpack_sequence(events))
+    # Chunks are deliberately not aligned with the event boundaries
+    chunks = [stream[i : i + 7] for i in range(0, len(stream), 7)]
+    assert list(from_msgpack_sequence(chunks)) == events
+
+
+def test_from_msgpack_sequence_invalid_data():
+    stream = to_msgpack(CloudEvent(test_attributes)) + b"\xc1"
+    with pytest.raises(cloud_exceptions.InvalidStructuredMsgPack):
+        list(from_msgpack_sequence([stream]))
+
+
+def test_from_msgpack_sequence_truncated_stream():
+    stream = to_msgpack(CloudEvent(test_attributes))
+    with pytest.raises(cloud_exceptions.InvalidStructuredMsgPack):
+        list(from_msgpack_sequence([stream[:-1]]))
+
+
+def test_msgpack_feature_not_installed(monkeypatch):
+    monkeypatch.setattr(cloudevents.conversion, "msgpack", None)
+    with pytest.raises(cloud_exceptions.MsgPackFeatureNotInstalled):
+        to_msgpack(CloudEvent(test_attributes))
+    # Raised when called, not only once the returned iterators are consumed
+    with pytest.raises(cloud_exceptions.MsgPackFeatureNotInstalled):
+        to_msgpack_sequence([])
+    with pytest.raises(cloud_exceptions.MsgPackFeatureNotInstalled):
+        from_msgpack_sequence([])
+
+
+@pytest.mark.parametrize("data", [bytearray(b"test123"), memoryview(b"test123")])
+def test_to_structured_base64_bytes_like_data(data):
+    event = CloudEvent(test_attributes, data)
+    _, body = to_structured(event)
+    assert json.loads(body)["data_base64"] == base64.b64encode(b"test123").decode()
+
+
+@pytest.mark.parametrize("specversion", ["0.3", "1.0"])
+def test_from_json_null_attributes(specversion):
+    payload = {
+        "type": "com.example.string",
+        "source": "https://example.com/event-producer",
+        "id": "1234",
+        "specversion": specversion,
+        "subject": None,
+        "ext1": None,
+    }
+    event = from_json(json.dumps(payload))
+    assert "subject" not in event
+    assert event["ext1"] is None
+
+
+def test_from_json_null_required_attribute():
+    payload = {
+        "type": "com.example.string",
+        "source": "https://example.com/event-producer",
+        "id": None,
+        "specversion": "1.0",
+    }
+    with pytest.raises(cloud_exceptions.InvalidRequiredFields):
+        from_json(json.dumps(payload))
+
+
+def test_json_non_finite_data_can_talk_to_itself():
+    event = CloudEvent(test_attributes, {"nan": float("nan"), "inf": float("inf")})
+    body = to_json(event)
+    assert b"NaN" in body and b"Infinity" in body
+    result = from_json(body)
+    assert math.isnan(result.data["nan"])
+    assert result.data["inf"] == float("inf")
+
+
+@pytest.mark.parametrize("number", [2**70, -(2**63) - 1, 2**64])
+def test_json_large_integer_data_can_talk_to_itself(number):
+    event = CloudEvent(test_attributes, {"n": number})
+    result = from_json(to_json(event)).data["n"]
+    # 2 ** 70 and 2 ** 64 also compare equal to their float approximations
+    assert type(result) is int and result == number
+    payload = {**test_attributes, "id": "1234", "specversion": "1.0", "data": number}
+    result = from_json(json.dumps(payload)).data
+    assert type(result) is int and result == number
+
+
+@pytest.mark.parametrize("data", [{}, {"x": None}, {"x": "nullable"}])
+def test_to_json_non_serializable_data(data):
+    event = CloudEvent(test_attributes, {**data, "t": datetime.datetime(2022, 7, 16)})
+    with pytest.raises(TypeError):
+        to_structured(event)
+    _, body = to_binary(event)
+    assert body == event.data
+
+
+class _Color(enum.Enum):
+    RED = "red"
+
+
+def test_to_json_uuid_and_enum_data():
+    data = {"id": uuid.UUID(int=1), "color": _Color.RED, "n": 2**70, "x": None}
+    event = CloudEvent(test_attributes, data)
+    assert json.loads(to_json(event))["data"] == {
+        "id": "00000000-0000-0000-0000-000000000001",
+        "color": "red",
+        "n": 2**70,
+        "x": None,
+    }
+
+
+def test_from_json_utf8_bom():
+    payload = {**test_attributes, "id": "1234", "specversion": "1.0", "data": 1}
+    event = from_json(codecs.BOM_UTF8 + json.dumps(payload).encode("utf-8"))
+    assert event.data == 1
+
+
+@pytest.mark.parametrize(
+    "given, expected",
+    [
+        (codecs.BOM_UTF8 + b'{"a": 1}', {"a": 1}),
+        ('{"a": 1}'.encode("utf-16"), {"a": 1}),
+        ('{"a": 1}'.encode("utf-16-be"), {"a": 1}),
+        ('{"a": 1}'.encode("utf-32"), {"a": 1}),
+        (bytearray(b' {"a": 1}'), {"a": 1}),
+        (b" " * 100 + b'{"a": 1}', {"a": 1}),
+        (b"\x89PNG", b"\x89PNG"),
+        (b"", b""),
+        (b"NaN", math.nan),
+        ("Infinity", math.inf),
+        ("not json", "not json"),
+    ],
+)
+def test_json_or_string(given, expected):
+    result = cloudevents.conversion._json_or_string(given)
+    if isinstance(expected, float) and math.isnan(expected):
+        assert math.isnan(result)
+    else:
+        assert result == expected
+
+
+def test_from_http_binary_with_non_dict_headers():
+    class ListKeysHeaders(collections.abc.Mapping):
+        def __init__(self, headers):
+            self._headers = headers
+
+        def __getitem__(self, key):
+            return self._headers[key]
+
+        def __iter__(self):
+            return iter(self._headers)
+
+        def __len__(self):
+            return len(self._headers)
+
+        def keys(self):
+            return list(self._headers)
+
+    headers = ListKeysHeaders(
+        {
+            "ce-specversion": "1.0",
+            "ce-id": "1234",
+            "ce-source": "https://example.com/event-producer",
+            "ce-type": "com.example.string",
+            "content-type": "application/json",
+        }
+    )
+    # Like Starlette's Headers, the keys are listed instead of being a set-like view
+    assert len(headers) == 5 and type(headers.keys()) is list
+    event = from_http(headers, test_data)
+    assert event["id"] == "1234"
+    assert event.data == {"data-key": "val"}
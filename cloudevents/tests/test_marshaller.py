@@ -58,6 +58,16 @@ def test_to_request_wrong_marshaller():
         _ = m.ToRequest(v1.Event(), data_marshaller="")
 
 
+def test_from_http_wrong_unmarshaller(structured_data):
+    with pytest.raises(exceptions.InvalidDataUnmarshaller):
+        from_http({}, structured_data, data_unmarshaller="")
+
+
+def test_from_http_structured_custom_unmarshaller_receives_json(structured_data):
+    event = from_http({}, structured_data, data_unmarshaller=lambda x: x)
+    assert event.data == '"test"'
+
+
 def test_from_request_cannot_read(binary_headers):
     with pytest.raises(exceptions.UnsupportedEventConverter):
         m = marshaller.HTTPMarshaller([binary.NewBinaryHTTPCloudEventConverter()])
@@ -115,6 +125,17 @@ def test_http_data_marshaller_exception(binary_headers, structured_data):
     )
 
 
+def test_to_request_structured_data_marshaller_exception():
+    m = marshaller.NewDefaultHTTPMarshaller()
+    event = v1.Event().SetData("test")
+    with pytest.raises(cloud_exceptions.DataMarshallerError) as e:
+        m.ToRequest(event, structured.JSONHTTPCloudEventConverter.TYPE, lambda x: 1 / 0)
+    assert (
+        "Failed to marshall data with error: "
+        "ZeroDivisionError('division by zero')" in str(e.value)
+    )
+
+
 @pytest.mark.parametrize("test_data", [[], {}, (), "", b"", None])
 def test_known_empty_edge_cases(binary_headers, test_data):
     expect_data = test_data
@@ -18,8 +18,14 @@ import json
 
 import pytest
 
-from cloudevents.conversion import to_json
-from cloudevents.pydantic import CloudEvent, from_dict, from_json
+from cloudevents.conversion import to_json, to_msgpack, to_msgpack_sequence
+from cloudevents.pydantic import (
+    CloudEvent,
+    from_dict,
+    from_json,
+    from_msgpack,
+    from_msgpack_sequence,
+)
 from cloudevents.sdk.event.attribute import SpecVersion
 
 test_data = json.dumps({"data-key": "val"})
@@ -132,6 +138,17 @@ def test_json_can_talk_to_itself_base64(specversion):
     assert event.data == data
 
 
+@pytest.mark.parametrize("specversion", ["0.3", "1.0"])
+def test_msgpack_can_talk_to_itself(specversion):
+    event = CloudEvent({**test_attributes, "specversion": specversion}, test_data)
+    assert from_msgpack(to_msgpack(event)) == event
+
+
+def test_msgpack_sequence_can_talk_to_itself():
+    events = [CloudEvent(test_attributes, {"index": i}) for i in range(3)]
+    assert list(from_msgpack_sequence(to_msgpack_sequence(events))) == events
+
+
 def test_from_dict():
     given = {
         "data": b"\x00\x00\x11Hello World",
@@ -34,6 +34,36 @@ def get_version(rel_path):
         raise RuntimeError("Unable to find version string.")
 
 
+def get_ext_modules():
+    """
+    Compiles the pure-Python conversion hot paths into C extensions with Cython.
+
+    Opt-in by setting the CLOUDEVENTS_COMPILE environment variable. Cython has
+    to be installed beforehand and build isolation disabled, e.g.
+    pip install cython && CLOUDEVENTS_COMPILE=1 pip install --no-build-isolation
+    --no-binary cloudevents cloudevents.
+    The compiled modules shadow the Python sources they are built from, which
+    remain the portable fallback.
+    """
+    if not os.environ.get("CLOUDEVENTS_COMPILE"):
+        return []
+
+    try:
+        from Cython.Build import cythonize
+    except ImportError:
+        raise RuntimeError(
+            "CLOUDEVENTS_COMPILE is set but Cython is not installed. Install "
+            "Cython and build with pip's --no-build-isolation flag."
+        )
+
+    return cythonize(
+        ["cloudevents/conversion.py", "cloudevents/sdk/event/base.py"],
+        # The annotations document duck-typed arguments (e.g. any headers mapping),
+        # they must not be enforced as exact C types.
+        compiler_directives={"language_level": "3", "annotation_typing": False},
+    )
+
+
 # FORMAT: 1.x.x
 pypi_config = {
     "version_target": get_version("cloudevents/__init__.py"),
@@ -67,6 +97,7 @@ if __name__ == "__main__":
             "Programming Language :: Python :: 3.10",
         ],
         packages=find_packages(exclude=["cloudevents.tests"]),
+        ext_modules=get_ext_modules(),
         version=pypi_config["version_target"],
         install_requires=["deprecation>=2.0,<3.0"],
         extras_require={
@@ -74,5 +105,7 @@ if __name__ == "__main__":
                 "pydantic>=1.0.0<1.9.0; python_version <= '3.6'",
                 "pydantic>=1.0.0<2.0; python_version > '3.6'",
             ],
+            "orjson": ["orjson>=3.0.0"],
+            "msgpack": ["msgpack>=1.0.0"],
         },
     )